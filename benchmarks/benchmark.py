@@ -0,0 +1,267 @@
+# benchmarks/benchmark.py
+#
+# Suite de benchmarks para los caminos críticos del broker y del solver.
+# Se ejecuta desde la raíz del repositorio (igual que el resto de scripts):
+#
+#   python benchmarks/benchmark.py                     # compara con la baseline
+#   python benchmarks/benchmark.py --update-baseline   # regenera la baseline
+#
+# Sólo usa la interfaz de loopback (127.0.0.1); no necesita red externa.
+# Termina con código 1 si alguna métrica empeora más que el umbral configurado.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, "broker_znta")
+sys.path.insert(0, "client_znta")
+sys.path.insert(0, "solver")
+
+import pulp
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+import broker
+import bulk_test_client
+import solver
+import validator
+
+# -------- CONFIG --------
+BASELINE_PATH = "benchmarks/baseline.json"
+DEFAULT_THRESHOLD = 0.5           # 50% peor que la baseline se considera regresión
+SOLVER_THRESHOLD = 1.0            # Umbral propio para el solver: sus tiempos incluyen lanzar CBC como proceso
+BASELINE_RUNS = 3                 # Ejecuciones completas cuya mediana forma la baseline
+ROUNDS = 5                        # Rondas por métrica; se guarda la mediana
+SOLVER_SIZES = [5, 10, 20, 40]    # Valores de NUM_INSTANCIAS a medir
+SOLVER_ROUNDS = 7
+VALIDATOR_ROWS = 2000             # Filas sintéticas para medir el throughput del validador
+DISTRIBUCION_PATH = "solver/distribucion.csv"
+
+# Contexto que pasa todas las políticas de policies.json
+VALID_CONTEXT = {
+    "username": "bench_user",
+    "role": "medico",
+    "device_hardening_score": 85,
+    "ip_address": "127.0.0.1",
+    "timestamp": "2025-05-12T10:00:00Z",
+    "device_os": "Ubuntu 22.04",
+    "antivirus_active": True,
+    "system_patched": True
+}
+
+# -------- FUNCIONES --------
+class QuietRequestHandler(WSGIRequestHandler):
+    # Sin una línea de log por petición durante el benchmark
+    def log_request(self, *args, **kwargs):
+        pass
+
+def measure(func, iterations, rounds=ROUNDS):
+    # Devuelve la mediana (en segundos) del tiempo por llamada, tras una llamada de calentamiento
+    func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter() - start) / iterations)
+    return statistics.median(samples)
+
+def metric(value, unit, higher_is_better=False):
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+def bench_micro(private_key, public_key, signature):
+    results = {}
+    results["verify_signature"] = metric(
+        measure(lambda: broker.verify_signature(public_key, broker.EXPECTED_NONCE, signature), 200), "s")
+    results["validate_context"] = metric(
+        measure(lambda: broker.validate_context(VALID_CONTEXT), 2000), "s")
+    results["log_access"] = metric(
+        measure(lambda: broker.log_access(VALID_CONTEXT, "allowed", "Acceso autorizado"), 2000), "s")
+    results["sign_nonce"] = metric(
+        measure(lambda: bulk_test_client.sign_nonce(private_key, bulk_test_client.NONCE), 50), "s")
+    return results
+
+def bench_verify_endpoint(signature):
+    results = {}
+    payload = {"context": VALID_CONTEXT, "nonce": broker.EXPECTED_NONCE, "signature": signature}
+
+    # Flask test client (sin sockets)
+    test_client = broker.app.test_client()
+
+    def post_test_client():
+        response = test_client.post("/verify", json=payload)
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    results["verify_test_client"] = metric(measure(post_test_client, 100), "s")
+
+    # Servidor real sobre loopback, usando el mismo send_request que el cliente de pruebas
+    server = make_server("127.0.0.1", 0, broker.app, threaded=True, request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    original_url = bulk_test_client.BROKER_URL
+    bulk_test_client.BROKER_URL = f"http://127.0.0.1:{server.server_port}/verify"
+    # requests respeta HTTP(S)_PROXY: se excluye 127.0.0.1 para que la petición no salga de loopback
+    original_no_proxy = {var: os.environ.get(var) for var in ("NO_PROXY", "no_proxy")}
+    for var in original_no_proxy:
+        os.environ[var] = "127.0.0.1"
+    try:
+        def post_loopback():
+            status, text = bulk_test_client.send_request(VALID_CONTEXT, signature)
+            assert status == 200, text
+
+        results["verify_loopback"] = metric(measure(post_loopback, 50), "s")
+    finally:
+        bulk_test_client.BROKER_URL = original_url
+        for var, value in original_no_proxy.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+        server.shutdown()
+        thread.join()
+    return results
+
+def bench_solver():
+    results = {}
+    for num_instancias in SOLVER_SIZES:
+        # Calentamiento sin medir: la primera llamada paga el arranque de CBC y de pulp
+        model, _, _ = solver.construir_modelo(num_instancias)
+        model.solve(pulp.PULP_CBC_CMD(msg=0))
+
+        build_samples = []
+        solve_samples = []
+        for _ in range(SOLVER_ROUNDS):
+            start = time.perf_counter()
+            model, _, _ = solver.construir_modelo(num_instancias)
+            build_samples.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            model.solve(pulp.PULP_CBC_CMD(msg=0))
+            solve_samples.append(time.perf_counter() - start)
+            if model.status != pulp.LpStatusOptimal:
+                raise RuntimeError(f"El solver no encontró solución óptima con {num_instancias} instancias")
+
+        results[f"solver_build_n{num_instancias}"] = metric(statistics.median(build_samples), "s")
+        # Para la resolución se guarda el mínimo: cada muestra lanza CBC y el ruido del arranque sólo suma
+        results[f"solver_solve_n{num_instancias}"] = metric(min(solve_samples), "s")
+    return results
+
+def bench_validator():
+    base = validator.cargar_instancias(DISTRIBUCION_PATH)
+    instancias = [base[i % len(base)] for i in range(VALIDATOR_ROWS)]
+    seconds = measure(lambda: validator.validar_instancias(instancias), 1)
+    return {"validator_throughput": metric(VALIDATOR_ROWS / seconds, "instancias/s", higher_is_better=True)}
+
+def run_benchmarks():
+    private_key = bulk_test_client.load_private_key(bulk_test_client.PRIVATE_KEY_PATH)
+    public_key = broker.load_public_key(broker.CERTIFICATE_PATH)
+    signature = bulk_test_client.sign_nonce(private_key, broker.EXPECTED_NONCE)
+
+    # Los accesos registrados durante el benchmark no deben ensuciar access_logs.csv
+    original_log_file = broker.LOG_FILE
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        broker.LOG_FILE = os.path.join(tmp_dir, "access_logs.csv")
+        try:
+            # El broker imprime trazas en cada petición; se silencian para no falsear tiempos
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = {}
+                results.update(bench_micro(private_key, public_key, signature))
+                results.update(bench_verify_endpoint(signature))
+                results.update(bench_solver())
+                results.update(bench_validator())
+        finally:
+            broker.LOG_FILE = original_log_file
+    return results
+
+def aggregate(runs):
+    # Mediana por métrica de varias ejecuciones completas, para que la baseline no dependa de una sola
+    results = {}
+    for name, entry in runs[0].items():
+        value = statistics.median(run[name]["value"] for run in runs)
+        results[name] = metric(value, entry["unit"], entry["higher_is_better"])
+    return results
+
+def format_value(entry):
+    if entry["unit"] == "s":
+        return f"{entry['value'] * 1000:.3f} ms"
+    return f"{entry['value']:.1f} {entry['unit']}"
+
+def compare(results, baseline, threshold, solver_threshold):
+    regressions = []
+    missing = [name for name in baseline if name not in results]
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<24} {format_value(current):>22}   (sin baseline)")
+            continue
+
+        # Misma escala en ambos sentidos: cuántas veces "peor" es el valor actual
+        if current["higher_is_better"]:
+            change = previous["value"] / current["value"] - 1
+        else:
+            change = current["value"] / previous["value"] - 1
+
+        limit = solver_threshold if name.startswith("solver_") else threshold
+        status = "OK"
+        if change > limit:
+            status = "REGRESIÓN"
+            regressions.append(name)
+        print(f"{name:<24} {format_value(current):>22}   baseline {format_value(previous):>22}   "
+              f"{change * 100:+7.1f}%  {status}")
+    for name in missing:
+        print(f"{name:<24} {'(no medida)':>22}   baseline {format_value(baseline[name]):>22}   FALTA")
+    return regressions, missing
+
+# -------- MAIN --------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks del broker ZNTA y del solver")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Fichero JSON con la baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Empeoramiento relativo máximo permitido (0.5 = 50%%)")
+    parser.add_argument("--solver-threshold", type=float, default=SOLVER_THRESHOLD,
+                        help="Empeoramiento relativo máximo permitido en las métricas del solver")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Guarda los resultados actuales como nueva baseline")
+    parser.add_argument("--baseline-runs", type=int, default=BASELINE_RUNS,
+                        help="Ejecuciones completas usadas al generar la baseline")
+    parser.add_argument("--output", help="Guarda también los resultados actuales en este JSON")
+    args = parser.parse_args()
+
+    if not args.update_baseline and not os.path.isfile(args.baseline):
+        print(f"❌ No existe la baseline '{args.baseline}'. Usa --update-baseline para generarla.")
+        sys.exit(2)
+
+    if args.update_baseline:
+        results = aggregate([run_benchmarks() for _ in range(args.baseline_runs)])
+    else:
+        results = run_benchmarks()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=4)
+        for name, entry in results.items():
+            print(f"{name:<24} {format_value(entry):>22}")
+        print(f"\n✔️ Baseline guardada en '{args.baseline}'.")
+        sys.exit(0)
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+
+    regressions, missing = compare(results, baseline, args.threshold, args.solver_threshold)
+    if regressions:
+        print(f"\n❌ Regresiones por encima del umbral: {', '.join(regressions)}")
+    if missing:
+        print(f"\n❌ Métricas de la baseline que ya no se miden: {', '.join(missing)}")
+    if regressions or missing:
+        sys.exit(1)
+    print("\n✔️ Ninguna métrica empeora por encima del umbral.")
@@ -74,95 +74,101 @@ tareas_personas_permitidas_final = {
 
 NUM_INSTANCIAS = 20
 
-# -------- MODELO PuLP (Global para todas las instancias) --------
-model = pulp.LpProblem("Asignacion_Global_Tareas_BPMS", pulp.LpMinimize)
-
-# Variables binarias: assign[k, tarea, persona_id]
-assign = pulp.LpVariable.dicts(
-    "assign",
-    ((k, tarea_name, p_id) for k in range(NUM_INSTANCIAS) 
-                             for tarea_name in tareas_list 
-                             for p_id in all_persona_ids),
-    cat="Binary"
-)
-
-# --------- RESTRICCIONES (Aplicadas a las NUM_INSTANCIAS) ---------
-
-# 1. Cada tarea en cada instancia asignada a UN ÚNICO rol permitido
-for k in range(NUM_INSTANCIAS):
-    for tarea_name, roles_permitidos_ids in tareas_personas_permitidas_final.items():
-        model += pulp.lpSum(assign[(k, tarea_name, p_id)] for p_id in roles_permitidos_ids) == 1, \
-                 f"AsignacionUnica_{k}_{tarea_name}"
-        # Adicional: asegurar que solo los permitidos puedan ser asignados (implícito si se suma sobre roles_permitidos_ids)
-        for p_id_general in all_persona_ids:
-            if p_id_general not in roles_permitidos_ids:
-                model += assign[(k, tarea_name, p_id_general)] == 0, f"NoPermitido_{k}_{tarea_name}_{p_id_general}"
-
-
-# 2. Cada persona como mucho realiza UNA tarea por instancia
-for k in range(NUM_INSTANCIAS):
-    for p_id in all_persona_ids:
-        model += pulp.lpSum(assign[(k, tarea_name, p_id)] for tarea_name in tareas_list) <= 1, \
-                 f"UnaTareaPorPersona_{k}_{p_id}"
-
-# 3. R1: Separación de deberes entre T2.1 y T2.2
-for k in range(NUM_INSTANCIAS):
-    for p_id in all_persona_ids:
-        model += assign[(k, "T2.1", p_id)] + assign[(k, "T2.2", p_id)] <= 1, \
-                 f"SoD_T21_T22_{k}_{p_id}"
-
-# 4. R2: Separación de deberes entre T3 y T4
-for k in range(NUM_INSTANCIAS):
-    for p_id in all_persona_ids:
-        model += assign[(k, "T3", p_id)] + assign[(k, "T4", p_id)] <= 1, \
-                 f"SoD_T3_T4_{k}_{p_id}"
-
-# 5. R3: Binding - Si GTR (ID 3) realiza T2.1, MDS (ID 7) realiza T2.2
+# IDs usados en las restricciones R3/R4 y en el balance de T1
 id_gtr = personas_name_to_id["GTR"]
 id_mds = personas_name_to_id["MDS"]
-for k in range(NUM_INSTANCIAS):
-    model += assign[(k, "T2.1", id_gtr)] <= assign[(k, "T2.2", id_mds)], \
-             f"Binding_GTR_MDS_{k}"
-
-# 6. R4: JVG (ID 1) sólo puede participar en T1
 id_jvg = personas_name_to_id["JVG"]
-for k in range(NUM_INSTANCIAS):
-    for tarea_name in ["T2.1", "T2.2", "T3", "T4"]:
-        model += assign[(k, tarea_name, id_jvg)] == 0, \
-                 f"JVG_Solo_T1_{k}_{tarea_name}"
-
-# --------- OBJETIVO (Fairness R5 + T1 Balance) ---------
-# R5: Minimizar la desviación de la participación promedio general
-participacion = {p_id: pulp.lpSum(assign[(k, t_name, p_id)] 
-                                for k in range(NUM_INSTANCIAS) 
-                                for t_name in tareas_list) 
-                 for p_id in all_persona_ids}
+id_hyv = personas_name_to_id["HYV"]
 
-avg_participation_val = (NUM_INSTANCIAS * len(tareas_list)) / len(all_persona_ids)
+# -------- MODELO PuLP (Global para todas las instancias) --------
+def construir_modelo(num_instancias=NUM_INSTANCIAS):
+    model = pulp.LpProblem("Asignacion_Global_Tareas_BPMS", pulp.LpMinimize)
+
+    # Variables binarias: assign[k, tarea, persona_id]
+    assign = pulp.LpVariable.dicts(
+        "assign",
+        ((k, tarea_name, p_id) for k in range(num_instancias) 
+                                 for tarea_name in tareas_list 
+                                 for p_id in all_persona_ids),
+        cat="Binary"
+    )
+
+    # --------- RESTRICCIONES (Aplicadas a las NUM_INSTANCIAS) ---------
+
+    # 1. Cada tarea en cada instancia asignada a UN ÚNICO rol permitido
+    for k in range(num_instancias):
+        for tarea_name, roles_permitidos_ids in tareas_personas_permitidas_final.items():
+            model += pulp.lpSum(assign[(k, tarea_name, p_id)] for p_id in roles_permitidos_ids) == 1, \
+                     f"AsignacionUnica_{k}_{tarea_name}"
+            # Adicional: asegurar que solo los permitidos puedan ser asignados (implícito si se suma sobre roles_permitidos_ids)
+            for p_id_general in all_persona_ids:
+                if p_id_general not in roles_permitidos_ids:
+                    model += assign[(k, tarea_name, p_id_general)] == 0, f"NoPermitido_{k}_{tarea_name}_{p_id_general}"
+
+
+    # 2. Cada persona como mucho realiza UNA tarea por instancia
+    for k in range(num_instancias):
+        for p_id in all_persona_ids:
+            model += pulp.lpSum(assign[(k, tarea_name, p_id)] for tarea_name in tareas_list) <= 1, \
+                     f"UnaTareaPorPersona_{k}_{p_id}"
+
+    # 3. R1: Separación de deberes entre T2.1 y T2.2
+    for k in range(num_instancias):
+        for p_id in all_persona_ids:
+            model += assign[(k, "T2.1", p_id)] + assign[(k, "T2.2", p_id)] <= 1, \
+                     f"SoD_T21_T22_{k}_{p_id}"
+
+    # 4. R2: Separación de deberes entre T3 y T4
+    for k in range(num_instancias):
+        for p_id in all_persona_ids:
+            model += assign[(k, "T3", p_id)] + assign[(k, "T4", p_id)] <= 1, \
+                     f"SoD_T3_T4_{k}_{p_id}"
+
+    # 5. R3: Binding - Si GTR (ID 3) realiza T2.1, MDS (ID 7) realiza T2.2
+    for k in range(num_instancias):
+        model += assign[(k, "T2.1", id_gtr)] <= assign[(k, "T2.2", id_mds)], \
+                 f"Binding_GTR_MDS_{k}"
+
+    # 6. R4: JVG (ID 1) sólo puede participar en T1
+    for k in range(num_instancias):
+        for tarea_name in ["T2.1", "T2.2", "T3", "T4"]:
+            model += assign[(k, tarea_name, id_jvg)] == 0, \
+                     f"JVG_Solo_T1_{k}_{tarea_name}"
+
+    # --------- OBJETIVO (Fairness R5 + T1 Balance) ---------
+    # R5: Minimizar la desviación de la participación promedio general
+    participacion = {p_id: pulp.lpSum(assign[(k, t_name, p_id)] 
+                                    for k in range(num_instancias) 
+                                    for t_name in tareas_list) 
+                     for p_id in all_persona_ids}
+
+    avg_participation_val = (num_instancias * len(tareas_list)) / len(all_persona_ids)
+
+    desviaciones_generales = {p_id: pulp.LpVariable(f"desviacion_general_{p_id}", lowBound=0) 
+                              for p_id in all_persona_ids}
 
-desviaciones_generales = {p_id: pulp.LpVariable(f"desviacion_general_{p_id}", lowBound=0) 
-                          for p_id in all_persona_ids}
+    for p_id in all_persona_ids:
+        model += participacion[p_id] - avg_participation_val <= desviaciones_generales[p_id]
+        model += avg_participation_val - participacion[p_id] <= desviaciones_generales[p_id]
 
-for p_id in all_persona_ids:
-    model += participacion[p_id] - avg_participation_val <= desviaciones_generales[p_id]
-    model += avg_participation_val - participacion[p_id] <= desviaciones_generales[p_id]
+    # Componente para equilibrar T1 entre JVG (ID 1) y HYV (ID 2)
+    count_T1_JVG = pulp.lpSum(assign[(k, "T1", id_jvg)] for k in range(num_instancias))
+    T1_JVG_target_deviation = pulp.LpVariable("T1_JVG_target_dev", lowBound=0)
+    target_T1_assignments_for_JVG = num_instancias / 2 # Idealmente 10 para JVG, 10 para HYV
 
-# Componente para equilibrar T1 entre JVG (ID 1) y HYV (ID 2)
-id_hyv = personas_name_to_id["HYV"]
-count_T1_JVG = pulp.lpSum(assign[(k, "T1", id_jvg)] for k in range(NUM_INSTANCIAS))
-T1_JVG_target_deviation = pulp.LpVariable("T1_JVG_target_dev", lowBound=0)
-target_T1_assignments_for_JVG = NUM_INSTANCIAS / 2 # Idealmente 10 para JVG, 10 para HYV
+    model += count_T1_JVG - target_T1_assignments_for_JVG <= T1_JVG_target_deviation
+    model += target_T1_assignments_for_JVG - count_T1_JVG <= T1_JVG_target_deviation
 
-model += count_T1_JVG - target_T1_assignments_for_JVG <= T1_JVG_target_deviation
-model += target_T1_assignments_for_JVG - count_T1_JVG <= T1_JVG_target_deviation
+    # Objetivo combinado:
+    weight_T1_balance = 1.0 # Ajustar según necesidad (e.g., 10.0 para priorizar T1 balance)
+    model += pulp.lpSum(desviaciones_generales[p_id] for p_id in all_persona_ids) + \
+             (weight_T1_balance * T1_JVG_target_deviation)
 
-# Objetivo combinado:
-weight_T1_balance = 1.0 # Ajustar según necesidad (e.g., 10.0 para priorizar T1 balance)
-model += pulp.lpSum(desviaciones_generales[p_id] for p_id in all_persona_ids) + \
-         (weight_T1_balance * T1_JVG_target_deviation)
+    return model, assign, count_T1_JVG
 
 # -------- MAIN --------
 if __name__ == "__main__":
+    model, assign, count_T1_JVG = construir_modelo(NUM_INSTANCIAS)
     solver = pulp.PULP_CBC_CMD(msg=1, timeLimit=300) # msg=0 para menos output, timeLimit opcional
     model.solve(solver)
 